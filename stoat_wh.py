@@ -29,15 +29,53 @@ License:
   MIT License (c) 2025 bjornmorten
 """
 
+from __future__ import annotations
+
 import argparse
 import json
 import os
 import sys
-import uuid
-from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import requests
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def _encode_stdlib(obj: Any) -> bytes:
+    # Same settings as requests' json=: ASCII-only output, and NaN is rejected.
+    return json.dumps(obj, separators=(",", ":"), allow_nan=False).encode()
 
-import requests
+
+if orjson is not None:
+    _loads = orjson.loads
+
+    def _encode(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson rejects integers beyond 64 bits and lone surrogates (from
+            # non-UTF-8 argv); stdlib json escapes those and the API validates.
+            return _encode_stdlib(obj)
+
+    def _dumps(obj: Any) -> str:
+        option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option).decode()
+
+else:
+    try:
+        from simdjson import loads as _loads  # type: ignore[no-redef, import-not-found]
+    except ImportError:
+        _loads = json.loads
+
+    _encode = _encode_stdlib
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2, sort_keys=True)
 
 BASE_URL = os.getenv("STOAT_API", "https://stoat.chat/api/webhooks")
 TIMEOUT = 15
@@ -45,6 +83,14 @@ TIMEOUT = 15
 PROJECT_URL = "https://github.com/bjornmorten/stoat-wh"
 USER_AGENT = f"stoat-wh/1.0 (+{PROJECT_URL})"
 
+ERROR_MESSAGES = {
+    "NotAuthenticated": "Invalid webhook token",
+    "NotFound": "Webhook not found - check if it exists and if the ID is correct",
+}
+
+SESSION: requests.Session | None = None
+PARSER: argparse.ArgumentParser | None = None
+
 
 def parse_webhook_source(args: list[str]) -> str:
     """Return normalized webhook URL from <id> <token> or <url>."""
@@ -61,18 +107,36 @@ def parse_webhook_source(args: list[str]) -> str:
     sys.exit(1)
 
 
+def get_session() -> requests.Session:
+    """Return the shared HTTP session, importing requests on first use."""
+    global SESSION
+    if SESSION is None:
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        SESSION = requests.Session()
+        SESSION.headers["User-Agent"] = USER_AGENT
+        SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=4))
+    return SESSION
+
+
 def safe_request(
-    method: str, url: str, *, debug: bool = False, **kwargs: Any
+    method: str,
+    url: str,
+    *,
+    debug: bool = False,
+    **kwargs: Any,
 ) -> requests.Response:
     """Perform HTTP request and handle errors."""
+    import requests
+
+    session = get_session()
     try:
-        headers = {"User-Agent": USER_AGENT, **kwargs.pop("headers", {})}
-        resp = requests.request(method, url, headers=headers, timeout=TIMEOUT, **kwargs)
+        resp = session.request(method, url, timeout=TIMEOUT, **kwargs)
         if not resp.ok:
             handle_error(resp, debug)
-        else:
-            if debug:
-                print(json.dumps(resp.json(), indent=2, sort_keys=True))
+        elif debug and resp.content:
+            print_json(_loads(resp.content))
         return resp
     except requests.RequestException as exc:
         print(f"Network error: {exc}", file=sys.stderr)
@@ -82,63 +146,91 @@ def safe_request(
 def handle_error(resp: requests.Response, debug: bool) -> None:
     """Decode and show friendly Stoat API error messages."""
     try:
-        data = resp.json()
-    except json.JSONDecodeError:
+        data = _loads(resp.content)
+    except ValueError:
         print(f"HTTP {resp.status_code}: {resp.text}", file=sys.stderr)
         sys.exit(resp.status_code)
     if debug:
-        print(json.dumps(data, indent=2), file=sys.stderr)
+        print(_dumps(data), file=sys.stderr)
         sys.exit(resp.status_code)
     etype = data.get("type")
-    msg = {
-        "NotAuthenticated": "Invalid webhook token",
-        "NotFound": "Webhook not found - check if it exists and if the ID is correct",
-        "FailedValidation": f"Validation failed: {data.get('error', 'unknown reason')}.",
-    }.get(etype, f"HTTP {resp.status_code}: {etype or resp.reason}")
+    msg = ERROR_MESSAGES.get(etype)
+    if msg is None:
+        if etype == "FailedValidation":
+            msg = f"Validation failed: {data.get('error', 'unknown reason')}."
+        else:
+            msg = f"HTTP {resp.status_code}: {etype or resp.reason}"
     print(f"Error: {msg}", file=sys.stderr)
     sys.exit(resp.status_code)
 
 
+def print_json(obj: Any) -> None:
+    """Pretty-print JSON to stdout, bypassing the text layer when using orjson."""
+    out = getattr(sys.stdout, "buffer", None)
+    if orjson is None or out is None:
+        print(_dumps(obj))
+        return
+    option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE
+    sys.stdout.flush()
+    out.write(orjson.dumps(obj, option=option))
+
+
 def read_stdin() -> str | None:
     """Read text piped to stdin, if any."""
     if sys.stdin.isatty():
         return None
-    text = sys.stdin.read().strip()
-    return text or None
+    buf = getattr(sys.stdin, "buffer", None)
+    text = buf.read().decode("utf-8", "replace") if buf else sys.stdin.read()
+    return text.strip() or None
+
+
+def new_idempotency_key() -> str:
+    """Return a random UUIDv4 string built directly from os.urandom."""
+    b = bytearray(os.urandom(16))
+    b[6] = (b[6] & 0x0F) | 0x40
+    b[8] = (b[8] & 0x3F) | 0x80
+    h = b.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
 
 
 def maybe_json(value: str | None) -> Any:
-    """Parse JSON or read from file path if exists."""
+    """Parse JSON, or read it from a file path if it is not valid JSON."""
     if not value:
         return None
-    p = Path(value)
-    if p.exists():
-        with p.open() as f:
-            return json.load(f)
     try:
-        return json.loads(value)
-    except json.JSONDecodeError as e:
-        raise ValueError(f"{value!r} is neither a JSON file nor valid JSON: {e.msg}")
+        return _loads(value)
+    except ValueError as e:
+        error = getattr(e, "msg", e)
+    try:
+        with open(value, "rb") as f:
+            data = f.read()
+    except (OSError, ValueError):  # ValueError: embedded null byte
+        raise ValueError(f"{value!r} is neither a JSON file nor valid JSON: {error}") from None
+    return _loads(data)
 
 
 def cmd_get(url: str, *, json_output: bool, debug: bool) -> None:
     resp = safe_request("GET", url, debug=debug)
-    data = resp.json()
+    data = _loads(resp.content)
     if json_output:
-        print(json.dumps(data, indent=2, sort_keys=True))
+        print_json(data)
     else:
-        print(f"Webhook ID : {data.get('id')}")
-        print(f"Name       : {data.get('name')}")
-        print(f"Creator    : {data.get('creator_id')}")
-        print(f"Channel    : {data.get('channel_id')}")
-        print(f"Permissions: {data.get('permissions')}")
+        lines = [
+            f"Webhook ID : {data.get('id')}",
+            f"Name       : {data.get('name')}",
+            f"Creator    : {data.get('creator_id')}",
+            f"Channel    : {data.get('channel_id')}",
+            f"Permissions: {data.get('permissions')}",
+        ]
         if "token" in data:
-            print(f"Token      : {data['token']}")
+            lines.append(f"Token      : {data['token']}")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_edit(url: str, *, name: str | None, debug: bool) -> None:
     payload = {"name": name} if name else {}
-    safe_request("PATCH", url, json=payload, debug=debug)
+    headers = {"Content-Type": "application/json"}
+    safe_request("PATCH", url, data=_encode(payload), headers=headers, debug=debug)
     print("Webhook updated.")
 
 
@@ -165,32 +257,44 @@ def cmd_send(
         print("Error: need content, stdin, or embeds.", file=sys.stderr)
         sys.exit(6)
 
-    data: dict[str, Any] = {}
-    if text:
-        data["content"] = text
-    if flags is not None:
-        data["flags"] = flags
-    if replies:
-        data["replies"] = [{"id": r, "mention": False} for r in replies]
-    if embeds:
-        try:
-            embed_data = [maybe_json(e) for e in embeds]
-        except ValueError as err:
-            print(f"Error parsing embed: {err}", file=sys.stderr)
-            sys.exit(5)
-        data["embeds"] = embed_data
-    if interactions:
-        data["interactions"] = maybe_json(interactions)
-
-    if username or avatar:
-        data["masquerade"] = {}
-        if username:
-            data["masquerade"]["name"] = username
-        if avatar:
-            data["masquerade"]["avatar"] = avatar
-
-    headers = {"Idempotency-Key": str(uuid.uuid4())}
-    safe_request("POST", url, json=data, headers=headers, debug=debug)
+    # Plain text messages are by far the most common; skip the general builder.
+    if flags is None and not (replies or embeds or interactions or username or avatar):
+        data: dict[str, Any] = {"content": text}
+    else:
+        data = {}
+        if text:
+            data["content"] = text
+        if flags is not None:
+            data["flags"] = flags
+        if replies:
+            data["replies"] = [{"id": r, "mention": False} for r in replies]
+        if embeds:
+            try:
+                embed_data = [maybe_json(e) for e in embeds]
+            except ValueError as err:
+                print(f"Error parsing embed: {err}", file=sys.stderr)
+                sys.exit(5)
+            data["embeds"] = embed_data
+        if interactions:
+            data["interactions"] = maybe_json(interactions)
+
+        if username or avatar:
+            data["masquerade"] = {}
+            if username:
+                data["masquerade"]["name"] = username
+            if avatar:
+                data["masquerade"]["avatar"] = avatar
+
+    headers = {
+        "Content-Type": "application/json",
+        "Idempotency-Key": new_idempotency_key(),
+    }
+    try:
+        body = _encode(data)
+    except ValueError as err:
+        print(f"Error encoding message: {err}", file=sys.stderr)
+        sys.exit(5)
+    safe_request("POST", url, data=body, headers=headers, debug=debug)
     print("Message sent.")
 
 
@@ -226,32 +330,118 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def get_parser() -> argparse.ArgumentParser:
+    """Return the shared argument parser, building it on first use."""
+    global PARSER
+    if PARSER is None:
+        PARSER = build_parser()
+    return PARSER
+
+
+# Options understood by fast_parse, per command: flag -> (dest, kind).
+FAST_OPTIONS: dict[str, dict[str, tuple[str, str]]] = {
+    "get": {"--json": ("json", "flag")},
+    "edit": {"--name": ("name", "value")},
+    "delete": {},
+    "send": {
+        "--content": ("content", "value"),
+        "-c": ("content", "value"),
+        "--username": ("username", "value"),
+        "--avatar": ("avatar", "value"),
+        "--flags": ("flags", "int"),
+        "--reply": ("reply", "list"),
+        "--embed": ("embed", "list"),
+        "--interactions": ("interactions", "value"),
+    },
+}
+
+
+def fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """Parse common invocations without building the argparse parser.
+
+    Returns None for anything it does not fully understand (help, option
+    abbreviations, values starting with '-', ...) so build_parser() stays
+    the ground truth for errors and edge cases.
+    """
+    debug = bool(argv) and argv[0] == "--debug"
+    if debug:
+        argv = argv[1:]
+    if not argv or argv[0] not in FAST_OPTIONS:
+        return None
+    cmd, *rest = argv
+    options = FAST_OPTIONS[cmd]
+    ns = argparse.Namespace(debug=debug, cmd=cmd, args=[])
+    for dest, kind in options.values():
+        setattr(ns, dest, False if kind == "flag" else None)
+
+    seen_option = False
+    i = 0
+    while i < len(rest):
+        token = rest[i]
+        i += 1
+        if not token.startswith("-"):
+            # argparse only accepts the positionals as one contiguous run.
+            if ns.args and seen_option:
+                return None
+            ns.args.append(token)
+            seen_option = False
+            continue
+        spec = options.get(token)
+        if spec is None:
+            return None
+        seen_option = True
+        dest, kind = spec
+        if kind == "flag":
+            setattr(ns, dest, True)
+        elif kind == "list":
+            values = []
+            while i < len(rest) and not rest[i].startswith("-"):
+                values.append(rest[i])
+                i += 1
+            setattr(ns, dest, values)
+        else:
+            if i >= len(rest) or rest[i].startswith("-"):
+                return None
+            value: Any = rest[i]
+            i += 1
+            if kind == "int":
+                try:
+                    value = int(value)
+                except ValueError:
+                    return None
+            setattr(ns, dest, value)
+    return ns if ns.args else None
+
+
 def main() -> None:
-    parser = build_parser()
-    ns = parser.parse_args()
+    ns = fast_parse(sys.argv[1:]) or get_parser().parse_args()
     url = parse_webhook_source(ns.args)
 
-    match ns.cmd:
-        case "get":
-            cmd_get(url, json_output=ns.json, debug=ns.debug)
-        case "edit":
-            cmd_edit(url, name=ns.name, debug=ns.debug)
-        case "delete":
-            cmd_delete(url, debug=ns.debug)
-        case "send":
-            cmd_send(
-                url,
-                content=ns.content,
-                username=ns.username,
-                avatar=ns.avatar,
-                flags=ns.flags,
-                replies=ns.reply,
-                embeds=ns.embed,
-                interactions=ns.interactions,
-                debug=ns.debug,
-            )
-        case _:
-            parser.print_help()
+    try:
+        match ns.cmd:
+            case "get":
+                cmd_get(url, json_output=ns.json, debug=ns.debug)
+            case "edit":
+                cmd_edit(url, name=ns.name, debug=ns.debug)
+            case "delete":
+                cmd_delete(url, debug=ns.debug)
+            case "send":
+                cmd_send(
+                    url,
+                    content=ns.content,
+                    username=ns.username,
+                    avatar=ns.avatar,
+                    flags=ns.flags,
+                    replies=ns.reply,
+                    embeds=ns.embed,
+                    interactions=ns.interactions,
+                    debug=ns.debug,
+                )
+            case _:
+                get_parser().print_help()
+    finally:
+        if SESSION is not None:
+            SESSION.close()
 
 
 if __name__ == "__main__":